@@ -6,7 +6,6 @@
 
 '''ARRI CLI tool'''
 
-import json
 import argparse
 import camdkit.arri.reader
 
@@ -18,7 +17,7 @@ def main():
 
   model = camdkit.arri.reader.to_clip(args.csv_path)
 
-  print(json.dumps(model.to_json(), indent=2))
+  print(model.to_json_bytes(indent=2).decode())
 
 if __name__ == "__main__":
   main()
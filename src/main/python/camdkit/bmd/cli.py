@@ -6,7 +6,6 @@
 
 '''BMD CLI tool'''
 
-import json
 import argparse
 import camdkit.bmd.reader
 
@@ -23,7 +22,7 @@ def main():
   with open(args.metadata_path, "r", encoding="utf-8") as fp:
     clip = camdkit.bmd.reader.to_clip(fp)
 
-  print(json.dumps(clip.to_json(), indent=2))
+  print(clip.to_json_bytes(indent=2).decode())
 
 if __name__ == "__main__":
   main()
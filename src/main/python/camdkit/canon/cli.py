@@ -6,7 +6,6 @@
 
 '''Canon CLI tool'''
 
-import json
 import argparse
 import camdkit.canon.reader
 
@@ -29,7 +28,7 @@ def main():
     open(args.frame_csv_path, "r", encoding="utf-8") as frame_csv:
     clip = camdkit.canon.reader.to_clip(static_csv, frame_csv)
 
-  print(json.dumps(clip.to_json(), indent=2))
+  print(clip.to_json_bytes(indent=2).decode())
 
 if __name__ == "__main__":
   main()
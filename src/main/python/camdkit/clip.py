@@ -5,7 +5,8 @@
 # Copyright Contributors to the SMTPE RIS OSVP Metadata Project
 
 """Types for modeling clips"""
-from typing import Annotated, Any, get_type_hints, Callable, Self, Optional
+from operator import attrgetter, index
+from typing import Annotated, Any, ClassVar, get_type_hints, Callable, Self, Optional
 
 from pydantic import Field, field_validator, BaseModel, ConfigDict
 from pydantic.json_schema import JsonSchemaMode, JsonSchemaValue
@@ -37,6 +38,10 @@
     "$schema": "https://json-schema.org/draft/2020-12/schema"
 }
 
+# Sampling labels as they appear in generated documentation
+STATIC_SAMPLING_LABEL = Sampling.STATIC.value.capitalize()
+REGULAR_SAMPLING_LABEL = Sampling.REGULAR.value.capitalize()
+
 
 class Static(CompatibleBaseModel):
     duration: Annotated[StrictlyPositiveRational | None,
@@ -57,10 +62,17 @@ def coerce_duration_to_strictly_positive_rational(cls, v):
 
 ModelPath = tuple[str, ...]
 TraversingFunction = Callable[[str, JsonSchemaValue, ModelPath, str], None]
+# clip property name, path of model fields leading to the holding model, field name
+ClipProperty = tuple[str, ModelPath, str]
 
 class Clip(CompatibleBaseModel):
 
     model_config = ConfigDict(extra="ignore")
+
+    # filled in by setup_clip_properties()
+    _static_props: ClassVar[tuple[ClipProperty, ...]] = ()
+    _regular_props: ClassVar[tuple[ClipProperty, ...]] = ()
+
     static: Static = Static()
 
     tracker: Tracker = Tracker()
@@ -176,30 +188,32 @@ def field_name_for_clip_property(model: BaseModel, clip_property_name: str) -> s
     # def add_property(cls, name: str, model_path: tuple[tuple[str, type], ...]):
     def add_property(cls, clip_property_name: str, model_path: ModelPath, field_name: str):
 
+        # Resolve everything that depends only on the path once, here, rather than on
+        # every access: the getter is a single C-level attrgetter, and the setter
+        # doesn't have to call get_type_hints() for each model along the path
+        getter = attrgetter(".".join(model_path + (field_name,)))
+        path_classes: list[tuple[str, type]] = []
+        model_class = cls
+        for model_field in model_path:
+            model_class = get_type_hints(model_class)[model_field]
+            path_classes.append((model_field, model_class))
+
         def get_through_path(instance):
-            obj = instance
-            model_fields: list[str] = [f for f in model_path] + [field_name]
-            # print(f"in getter, model_fields: {model_fields}")
-            for model_field in model_fields:
-                try:
-                    obj = getattr(obj, model_field)
-                except AttributeError:
-                    return None
-            return obj
+            try:
+                return getter(instance)
+            except AttributeError:
+                return None
 
         def set_through_path(instance, value: Any) -> None:
-            model_class = instance.__class__
             obj = instance
             # print(f"in setter, model_path: {model_path}, field_name: {field_name}")
-            if model_path:
-                for model_field in model_path:
-                    model_class = get_type_hints(model_class)[model_field]
-                    # print(f"in setter, model_field: {model_field} model_class: {model_class}")
-                    if not hasattr(obj, model_field) or getattr(obj, model_field) is None:
-                        defaulted_instance = model_class()
-                        # print("in setter, defaulted instance: {defaulted_instance}")
-                        setattr(obj, model_field, defaulted_instance)
-                    obj = getattr(obj, model_field)
+            for model_field, path_class in path_classes:
+                next_obj = getattr(obj, model_field, None)
+                if next_obj is None:
+                    next_obj = path_class()
+                    setattr(obj, model_field, next_obj)
+                    next_obj = getattr(obj, model_field)
+                obj = next_obj
             setattr(obj, field_name, value)
 
         # print(f"called setattr({cls}, {clip_property_name}, {property(get_through_path, set_through_path)}")
@@ -209,6 +223,9 @@ def set_through_path(instance, value: Any) -> None:
 
     @classmethod
     def setup_clip_properties(cls) -> type:
+        static_props: list[ClipProperty] = []
+        regular_props: list[ClipProperty] = []
+
         def property_adder(property_name: str,
                            property_schema: JsonSchemaValue,
                            model_path: ModelPath,
@@ -216,9 +233,13 @@ def property_adder(property_name: str,
             clip_property_name = property_schema["clip_property"]
             # print(f"calling cls.add_property({clip_property_name}, {property_name}, {model_path})")
             cls.add_property(clip_property_name, model_path, field_name)
+            (static_props if "static" in model_path else regular_props).append(
+                (clip_property_name, model_path, field_name))
 
-        full_schema = cls.make_json_schema(mode='validation', exclude_camdkit_internals=False)
+        full_schema = cls._cached_json_schema('validation', False)
         cls.traverse_json_schema(Clip, full_schema, (), property_adder)
+        cls._static_props = tuple(static_props)
+        cls._regular_props = tuple(regular_props)
         return cls
 
     @classmethod
@@ -237,14 +258,14 @@ def document_clip_property(property_name: str,
                 "canonical_name": property_name,
                 "description": property_schema["description"],
                 "constraints": property_schema["constraints"] if "constraints" in property_schema else None,
-                "sampling": (Sampling.STATIC.value.capitalize()
+                "sampling": (STATIC_SAMPLING_LABEL
                              if "static" in model_path or property_schema["clip_property"] == "duration"
-                             else Sampling.REGULAR.value.capitalize()),
+                             else REGULAR_SAMPLING_LABEL),
                 "section": (section if section and property_schema["clip_property"] != "duration" else "None"),
                 "units": property_schema["units"] if "units" in property_schema else "None"
             })
 
-        full_schema = Clip.make_json_schema(mode='validation', exclude_camdkit_internals=False)
+        full_schema = Clip._cached_json_schema('validation', False)
         Clip.traverse_json_schema(Clip, full_schema, ('',), document_clip_property)
         return documentation
 
@@ -254,49 +275,53 @@ def make_json_schema(cls, mode: JsonSchemaMode = 'serialization',
         result = CLIP_SCHEMA_PRELUDE | super(Clip, cls).make_json_schema(mode, exclude_camdkit_internals)
         return result
 
-    def append(self, other: Self) -> None:
-        full_schema = Clip.make_json_schema(mode='validation', exclude_camdkit_internals=False)
-
-        def appender(property_name: str,
-                     property_schema: JsonSchemaValue,
-                     model_path: ModelPath,
-                     field_name: str) -> None:
-            if "clip_property" in property_schema and 'static' not in model_path:
-                clip_property_name = property_schema["clip_property"]
-                if getattr(other, clip_property_name):  # anything to copy?
-                    if ours := getattr(self, clip_property_name):
-                        setattr(self, clip_property_name,
-                                getattr(self, clip_property_name) + getattr(other, clip_property_name))
-                    else:
-                        setattr(self, clip_property_name, getattr(other, clip_property_name))
+    def _set_validated(self, model_path: ModelPath, field_name: str, value: Any) -> None:
+        """Store a value that is already known to be valid (e.g. because it was
+        taken from, or assembled from, fields of another Clip) without the
+        re-validation that assignment through the clip property would trigger.
+        """
+        obj = self
+        for model_field in model_path:
+            obj = getattr(obj, model_field)
+        obj.__dict__[field_name] = value
+        obj.__pydantic_fields_set__.add(field_name)
 
-        Clip.traverse_json_schema(Clip, full_schema, ('',), appender)
+    def append(self, other: Self) -> None:
+        for clip_property_name, model_path, field_name in self._regular_props:
+            if theirs := getattr(other, clip_property_name):  # anything to copy?
+                if ours := getattr(self, clip_property_name):
+                    # both sides were validated when set, so the concatenation is
+                    # valid too; re-validating it would make repeated appends O(n²)
+                    self._set_validated(model_path, field_name, ours + theirs)
+                else:
+                    self._set_validated(model_path, field_name, theirs)
 
     def __getitem__(self, i) -> Self:
-        full_schema = Clip.make_json_schema(mode='validation', exclude_camdkit_internals=False)
+        # frames are copied without re-validation, so only a single frame may be
+        #   selected; a slice would wrap a tuple of values as if it were one value
+        i = index(i)
         result = Clip()
-
-        def extractor(property_name: str,
-                      property_schema: JsonSchemaValue,
-                      model_path: ModelPath,
-                      field_name: str) -> None:
-            if "clip_property" in property_schema:
-                clip_property_name = property_schema["clip_property"]
-                if ours := getattr(self, clip_property_name):
-                    setattr(result, clip_property_name,
-                            ours if "static" in model_path else (ours[i],))
-
-        Clip.traverse_json_schema(Clip, full_schema, ('',), extractor)
+        for clip_property_name, model_path, field_name in self._static_props:
+            if ours := getattr(self, clip_property_name):
+                result._set_validated(model_path, field_name, ours)
+        for clip_property_name, model_path, field_name in self._regular_props:
+            if ours := getattr(self, clip_property_name):
+                result._set_validated(model_path, field_name, (ours[i],))
         return result
 
     def to_json(self, i: Optional[int] = None) -> Self:
-        if i != None:
+        if i is not None:
             single_frame_clip: Self =  self[i]
             return CompatibleBaseModel.to_json(single_frame_clip)
         return CompatibleBaseModel.to_json(self)
 
+    def to_json_bytes(self, i: Optional[int] = None, indent: Optional[int] = None) -> bytes:
+        if i is not None:
+            return CompatibleBaseModel.to_json_bytes(self[i], indent)
+        return CompatibleBaseModel.to_json_bytes(self, indent)
+
     def _print_non_none(self):
-        full_schema = Clip.make_json_schema(mode='validation', exclude_camdkit_internals=False)
+        full_schema = Clip._cached_json_schema('validation', False)
 
         def non_none_printer(property_name: str,
                              property_schema: JsonSchemaValue,
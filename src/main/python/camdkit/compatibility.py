@@ -9,14 +9,16 @@
 import jsonref
 
 from abc import abstractmethod
+from functools import cache
 from typing import Final, Any, Self
 from copy import deepcopy
 
-from pydantic import BaseModel, ValidationError, ConfigDict
+from pydantic import BaseModel, ValidationError, ConfigDict, TypeAdapter
 from pydantic.json_schema import (GenerateJsonSchema,
                                   JsonSchemaValue,
                                   JsonSchemaMode)
 
+from pydantic_core import to_json
 from pydantic_core.core_schema import ModelField
 
 __all__ = [
@@ -95,6 +97,12 @@
 ALWAYS_EXCLUDED = ("title",)
 EXCLUDED_CAMDKIT_INTERNALS = ("clip_property", "constraints")
 
+# Fields describing a parameter rather than holding its value, never serialized
+EXCLUDED_FROM_JSON: Final[frozenset[str]] = frozenset(("canonical_name",
+                                                       "sampling",
+                                                       "units",
+                                                       "section"))
+
 
 def scrub_excluded(d: JsonSchemaValue, unwanted: tuple[str, ...]) -> JsonSchemaValue:
     for key, value in d.items():
@@ -271,7 +279,9 @@ class CompatibleBaseModel(BaseModel):
                               validate_assignment=True,
                               use_enum_values=True,
                               extra="forbid",
-                              use_attribute_docstrings=True)
+                              use_attribute_docstrings=True,
+                              # write non-finite floats as json.dumps() would
+                              ser_json_inf_nan="constants")
 
     @classmethod
     def validate(cls, value:Any) -> bool:
@@ -285,35 +295,93 @@ def validate(cls, value:Any) -> bool:
     def to_json(cls, model_or_tuple: Self | tuple):
         def inner(one_or_many: Self | tuple):
             if isinstance(one_or_many, tuple):
+                if all(type(e) is cls for e in one_or_many):
+                    # serialize the whole sequence in one call rather than once per element
+                    excluded = cls._excluded_from_json()
+                    return cls._tuple_adapter().dump_python(one_or_many,
+                                                            by_alias=True,
+                                                            exclude_none=True,
+                                                            exclude_defaults=True,
+                                                            exclude=({"__all__": excluded}
+                                                                     if excluded else None))
                 return tuple([inner(e) for e in one_or_many])
             return one_or_many.model_dump(by_alias=True,
                                             exclude_none=True,
                                             exclude_defaults=True,
-                                            exclude={"canonical_name",
-                                                     "sampling",
-                                                     "units",
-                                                     "section"})
+                                            exclude=one_or_many._excluded_from_json() or None)
         return inner(model_or_tuple)
 
+    @classmethod
+    def to_json_bytes(cls, model_or_tuple: Self | tuple, indent: int | None = None) -> bytes:
+        """Return the JSON encoding of what to_json() would return, serialized
+        directly from the model(s) without building intermediate dicts"""
+        if isinstance(model_or_tuple, tuple):
+            if all(type(e) is cls for e in model_or_tuple):
+                excluded = cls._excluded_from_json()
+                return cls._tuple_adapter().dump_json(model_or_tuple,
+                                                      indent=indent,
+                                                      by_alias=True,
+                                                      exclude_none=True,
+                                                      exclude_defaults=True,
+                                                      exclude=({"__all__": excluded}
+                                                               if excluded else None))
+            return to_json(cls.to_json(model_or_tuple), indent=indent, inf_nan_mode="constants")
+        return model_or_tuple.__pydantic_serializer__.to_json(model_or_tuple,
+                                                              indent=indent,
+                                                              by_alias=True,
+                                                              exclude_none=True,
+                                                              exclude_defaults=True,
+                                                              exclude=model_or_tuple._excluded_from_json() or None)
+
+    @classmethod
+    @cache
+    def _excluded_from_json(cls) -> frozenset[str]:
+        """Those of the model's fields which to_json() must leave out; usually none,
+        in which case serialization can skip exclusion processing altogether"""
+        return frozenset(EXCLUDED_FROM_JSON & cls.model_fields.keys())
+
     @classmethod
     def from_json(cls, json_or_tuple: JsonSchemaValue | tuple[Any, ...]) -> Any:
         """Return a validated object from a JSON dict, or tuple of validated objects
         from a tuple of JSON dicts, or a tuple of tuples of validated objects from
         a tuple of tuples of JSON dicts, or ... it's basically JSON all the way down
         """
+        def is_json_object(value) -> bool:
+            return isinstance(value, dict) and all(type(k) is str for k in value.keys())
+
         def inner(value) -> cls | tuple[cls, ...]:
-            if isinstance(value, dict) and all([type(k) == str for k in value.keys()]):
+            if is_json_object(value):
                 return cls.model_validate(value)
             elif isinstance(value, tuple):
+                if all(is_json_object(v) for v in value):
+                    # the common case: validate the whole sequence in one call
+                    # rather than once per element
+                    return cls._tuple_adapter().validate_python(value)
                 return tuple([inner(v) for v in value])
             else:
                 raise ValueError(f"unhandled type {type(value)} supplied to"
                                  f" {cls.__name__}.from_json()")
         return inner(json_or_tuple)
 
+    @classmethod
+    @cache
+    def _tuple_adapter(cls) -> TypeAdapter:
+        """Validator for a tuple of instances of the model, built on first use"""
+        return TypeAdapter(tuple[cls, ...])
+
     @classmethod
     def make_json_schema(cls, mode: JsonSchemaMode = 'serialization',
                          exclude_camdkit_internals: bool = True) -> JsonSchemaValue:
+        return deepcopy(cls._cached_json_schema(mode, exclude_camdkit_internals))
+
+    @classmethod
+    @cache
+    def _cached_json_schema(cls, mode: JsonSchemaMode,
+                            exclude_camdkit_internals: bool) -> JsonSchemaValue:
+        """Generate the schema once per model class, mode and exclusion setting.
+        The result is shared between callers and must not be modified; use
+        make_json_schema() to get a private copy.
+        """
         schema = cls.model_json_schema(schema_generator=(ExternalCompatibleSchemaGenerator
                                                          if exclude_camdkit_internals
                                                          else InternalCompatibleSchemaGenerator),
@@ -6,7 +6,6 @@
 
 '''Mo-Sys CLI tool'''
 
-import json
 import argparse
 import camdkit.framework
 import camdkit.mosys.reader
@@ -24,7 +23,7 @@ def main():
   # First 10 frames
   clip = camdkit.mosys.reader.to_clip(args.frame_f4_path, 10)
   # Print frame 0 of the clip
-  print(json.dumps(clip.to_json(0), indent=2))
+  print(clip.to_json_bytes(0, indent=2).decode())
   
   
 if __name__ == "__main__":
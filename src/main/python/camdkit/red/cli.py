@@ -6,7 +6,6 @@
 
 '''RED CLI tool'''
 
-import json
 import argparse
 import camdkit.red.reader
 
@@ -29,7 +28,7 @@ def main():
     open(args.meta_5_file_path, "r", encoding="utf-8") as type_5_file:
     clip = camdkit.red.reader.to_clip(type_3_file, type_5_file)
 
-  print(json.dumps(clip.to_json(), indent=2))
+  print(clip.to_json_bytes(indent=2).decode())
 
 if __name__ == "__main__":
   main()
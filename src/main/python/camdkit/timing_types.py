@@ -8,7 +8,6 @@
 
 from enum import Enum, verify, UNIQUE, StrEnum, unique
 from typing import Annotated, Optional
-from fractions import Fraction
 
 from pydantic import Field, field_validator, model_validator
 
@@ -52,8 +51,6 @@ class SynchronizationPTPPriorities(CompatibleBaseModel):
     def __init__(self, priority1: int, priority2: int):
         super(SynchronizationPTPPriorities, self).__init__(priority1=priority1,
                                                            priority2=priority2)
-        self.priority1 = priority1
-        self.priority2 = priority2
 
 
 @unique
@@ -87,7 +84,8 @@ def coerce_frame_rate_to_strictly_positive_rational(cls, v):
 
     @model_validator(mode="after")
     def check_frames_allowed_by_format(self):
-        if self.frames >= Fraction(self.frame_rate.num, self.frame_rate.denom).__ceil__():
+        # integer ceiling of num / denom, without building a Fraction
+        if self.frames >= -(-self.frame_rate.num // self.frame_rate.denom):
             raise ValueError("The frame number must be less than the frame rate.")
         return self
 
@@ -5,8 +5,7 @@
 # Copyright Contributors to the SMTPE RIS OSVP Metadata Project
 
 """Types for modeling of spatial transforms"""
-from multiprocessing.context import DefaultContext
-from typing import Optional, Annotated
+from typing import Annotated
 
 from pydantic import Field
 
@@ -6,7 +6,6 @@
 
 '''Venice CLI tool'''
 
-import json
 import argparse
 import camdkit.venice.reader
 
@@ -29,7 +28,7 @@ def main():
     open(args.dyn_csv_path, "r", encoding="utf-8") as dynamic_file:
     clip = camdkit.venice.reader.to_clip(static_file, dynamic_file)
 
-  print(json.dumps(clip.to_json(), indent=2))
+  print(clip.to_json_bytes(indent=2).decode())
 
 if __name__ == "__main__":
   main()
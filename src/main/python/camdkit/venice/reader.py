@@ -19,6 +19,10 @@
   "nrt" : "urn:schemas-professionalDisc:nonRealTimeMeta:ver.2.10"
 }
 
+_CAPTURE_FPS_RE = re.compile(r"([0-9.]+)[a-zA-Z]")
+_FRAC_STOP_RE = re.compile(r"T ([0-9]+)(?: ([0-9]/10))?")
+_PIXEL_ASPECT_RATIO_RE = re.compile(r"([0-9]+):([0-9]+)")
+
 def find_value(doc: ET.ElementTree, item_name: str) -> typing.Optional[str]:
   elem = doc.find(f".//nrt:Item[@name='{item_name}']" , namespaces=NS_PREFIXES)
 
@@ -76,7 +80,7 @@ def find_fps(doc: ET.ElementTree)  -> typing.Optional[Fraction]:
   if attr is None:
     return None
 
-  fps_match = re.fullmatch("([0-9.]+)[a-zA-Z]", attr)
+  fps_match = _CAPTURE_FPS_RE.fullmatch(attr)
 
   if fps_match is None:
     return None
@@ -118,7 +122,7 @@ def find_px_dims(doc: ET.ElementTree) -> typing.Optional[camdkit.model.Dimension
 
 def t_number_from_frac_stop(frac_stop_str: str) -> typing.Optional[float]:
 
-  m = re.fullmatch("T ([0-9]+)(?: ([0-9]/10))?", frac_stop_str)
+  m = _FRAC_STOP_RE.fullmatch(frac_stop_str)
 
   if m is None:
     return None
@@ -159,7 +163,7 @@ def to_clip(static_file: typing.IO, dynamic_file: typing.IO) -> camdkit.model.Cl
 
   pixel_aspect_ratio = find_value(clip_metadata, "PixelAspectRatio")
   if pixel_aspect_ratio is not None:
-    m = re.fullmatch("([0-9]+):([0-9]+)", pixel_aspect_ratio)
+    m = _PIXEL_ASPECT_RATIO_RE.fullmatch(pixel_aspect_ratio)
     if m is not None:
       clip.anamorphic_squeeze = Fraction(int(m.group(1)), int(m.group(2)))
 
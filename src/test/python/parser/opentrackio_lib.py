@@ -153,7 +153,7 @@ def import_schema(self):
 
     
     def parse_cbor(self, data):
-        if data != None:
+        if data is not None:
             try:
                 self.pd = loads(data)
             except Exception as e:
@@ -162,7 +162,7 @@ def parse_cbor(self, data):
             raise OpenTrackIOException("Error: CBOR data cannot be empty.")
             
     def parse_json(self, data):
-        if data != None:
+        if data is not None:
             try:
                 self.pd = json.loads(data)
             except Exception as e:
@@ -304,7 +304,7 @@ def set_translation_units(self, unit: TranslationUnit):
             print("Setting preferred camera translation units to: {0}".format(unit.value))
         if schema_units == "meter":
             self.trans_mult = unit
-        elif schema_units == None:
+        elif schema_units is None:
             raise OpenTrackIOException("Error: camera translation units not found in schema.")
 
     def set_rotation_units(self, unit: RotationUnit):
@@ -318,7 +318,7 @@ def set_rotation_units(self, unit: RotationUnit):
             print("Setting preferred camera rotation units to: {0}".format(unit.value))
         if schema_units == "degree":
             self.rot_mult = unit
-        elif schema_units == None:
+        elif schema_units is None:
             raise OpenTrackIOException("Error: camera rotation units not found in schema.")
 
     def set_sample_time_format(self, format: TimeFormat):
@@ -344,7 +344,7 @@ def set_focus_distance_units(self, unit: FocusDistanceUnit):
             print("Setting preferred focus distance units to: {}".format(unit.value))
         if schema_units == "millimeter":
             self.focus_dist_mult = unit.conversion_factor_from_mm()
-        elif schema_units == None:
+        elif schema_units is None:
             raise OpenTrackIOException("Error: focus distance units not found in schema")
 
     def get_protocol_name(self):
@@ -253,7 +253,7 @@ def _create_opentrackio_packet(self) -> list[bytes]:
                 "status": "Optical Good"
             },
             "timing": {
-                "mode": "internal" if self._time_source in [TimeSource.NTP, TimeSource.PTP] else "external",
+                "mode": "internal" if self._time_source in (TimeSource.NTP, TimeSource.PTP) else "external",
                 "sampleRate": {
                     "num": self.BASE_FREQUENCY,
                     "denom": self.FREQUENCY_DENOM
@@ -323,7 +323,7 @@ def _create_opentrackio_packet(self) -> list[bytes]:
             ]
         }
 
-        if self._time_source in [TimeSource.GENLOCK, TimeSource.VIDEO_IN]:
+        if self._time_source in (TimeSource.GENLOCK, TimeSource.VIDEO_IN):
             payload_data["timing"]["synchronization"]["frequency"] = {
                 "num": self.BASE_FREQUENCY,
                 "denom": self.FREQUENCY_DENOM
@@ -483,6 +483,42 @@ def test_append(self):
         self.assertEqual(entrance_pupil_offset_post_append, a.lens_entrance_pupil_offset)
         self.assertEqual(t_stop_post_append, a.lens_t_number)
 
+    def test_repeated_append(self):
+        translation = Vector3(x=1.0, y=2.0, z=3.0)
+        rotation = Rotator3(pan=1.0, tilt=2.0, roll=3.0)
+        transforms = (Transform(translation=translation, rotation=rotation),)
+        accumulated = Clip()
+        for focus_distance in (1.0, 2.0, 3.0, float("inf")):
+            frame = Clip()
+            frame.lens_focus_distance = (focus_distance,)
+            frame.transforms = (transforms,)
+            accumulated.append(frame)
+        self.assertEqual((1.0, 2.0, 3.0, float("inf")), accumulated.lens_focus_distance)
+        self.assertEqual((transforms,) * 4, accumulated.transforms)
+        self.assertEqual(accumulated, Clip.from_json(Clip.to_json(accumulated)))
+        self.assertEqual(json.loads(json.dumps(accumulated.to_json())),
+                         json.loads(accumulated.to_json_bytes()))
+        self.assertEqual(json.loads(json.dumps(accumulated.to_json(3))),
+                         json.loads(accumulated.to_json_bytes(3)))
+        self.assertEqual(accumulated, Clip.from_json(json.loads(accumulated.to_json_bytes())))
+
+    def test_getitem_selects_single_frames_only(self):
+        clip = Clip()
+        clip.duration = StrictlyPositiveRational(3, 1)
+        clip.lens_focus_distance = (1.0, 2.0, 3.0)
+        frame = clip[1]
+        self.assertEqual(clip.duration, frame.duration)
+        self.assertEqual((2.0,), frame.lens_focus_distance)
+        self.assertEqual((3.0,), clip[-1].lens_focus_distance)
+        with self.assertRaises(TypeError):
+            clip[0:2]
+        with self.assertRaises(TypeError):
+            clip.to_json(slice(0, 2))
+        with self.assertRaises(TypeError):
+            clip.to_json_bytes(slice(0, 2))
+        with self.assertRaises(IndexError):
+            clip[3]
+
     def test_make_documentation(self):
 
         def print_doc_entry(entry, fp) -> None:
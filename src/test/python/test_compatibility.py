@@ -17,6 +17,7 @@
 
 from camdkit.camera_types import StaticCamera
 from camdkit.compatibility import CompatibleBaseModel
+from camdkit.transform_types import Vector3
 
 class PureOpt(BaseModel):
     a: int
@@ -170,6 +171,49 @@ def test_schema_generation(self):
         self.assertDictEqual(EXPECTED_PURE_ARRAY_SCHEMA, PureArray.model_json_schema())
         self.assertDictEqual(EXPECTED_OPT_ARRAY_SCHEMA, OptArray.model_json_schema())
 
+    def test_schema_caching_returns_independent_copies(self):
+        first = CompatiblePureOpt.make_json_schema()
+        first["properties"].pop("a")
+        second = CompatiblePureOpt.make_json_schema()
+        self.assertDictEqual(EXPECTED_COMPATIBLE_PURE_OPT_SCHEMA, second)
+        self.assertIsNot(first, second)
+
+    def test_from_json_of_tuples(self):
+        one = {"a": 1, "c": "x"}
+        two = {"a": 2, "b": 3, "c": "y"}
+        expected = (CompatiblePureOpt(a=1, c="x"), CompatiblePureOpt(a=2, b=3, c="y"))
+        self.assertEqual(expected, CompatiblePureOpt.from_json((one, two)))
+        self.assertEqual((expected, expected[:1]),
+                         CompatiblePureOpt.from_json(((one, two), (one,))))
+        with self.assertRaises(ValueError):
+            CompatiblePureOpt.from_json((one, {"a": "not an int", "c": "z"}))
+        with self.assertRaises(ValueError):
+            CompatiblePureOpt.from_json((one, 3))
+        with self.assertRaises(ValueError):
+            CompatiblePureOpt.from_json((one, {"a": 2, "c": "y", 1: 2}))
+
+    def test_to_json_of_tuples(self):
+        one = CompatiblePureOpt(a=1, c="x")
+        two = CompatiblePureOpt(a=2, b=3, c="y")
+        expected = ({"a": 1, "c": "x"}, {"a": 2, "b": 3, "c": "y"})
+        self.assertEqual(expected, CompatiblePureOpt.to_json((one, two)))
+        self.assertEqual((expected, expected[:1]),
+                         CompatiblePureOpt.to_json(((one, two), (one,))))
+        self.assertEqual(expected, CompatibleBaseModel.to_json((one, two)))
+
+    def test_to_json_bytes(self):
+        one = CompatiblePureOpt(a=1, c="x")
+        two = CompatiblePureOpt(a=2, b=3, c="y")
+        for value in (one, (one, two), ((one, two), (one,))):
+            self.assertEqual(json.loads(json.dumps(CompatiblePureOpt.to_json(value))),
+                             json.loads(CompatiblePureOpt.to_json_bytes(value)))
+        # non-finite floats must be encoded the same way however deeply nested
+        v = Vector3(x=float("inf"), y=1.0, z=2.0)
+        for value in (v, (v,), ((v,),)):
+            expected = json.dumps(Vector3.to_json(value), separators=(",", ":")).encode()
+            self.assertEqual(expected, Vector3.to_json_bytes(value))
+            self.assertEqual(expected, CompatibleBaseModel.to_json_bytes(value))
+
     def test_annotated_opt_same_as_pure_opt(self):
         """Convince ourselves Annotated leaves no trace in generated schema"""
         pure_opt_schema = PureOpt.model_json_schema()
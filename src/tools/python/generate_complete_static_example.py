@@ -6,8 +6,9 @@
 
 '''CLI tool to generate and validate JSON for an example OpenTrackIO complete static metadata sample'''
 
-import json
+from pydantic_core import to_json
+
 from camdkit.examples import get_complete_static_example
 
 if __name__ == "__main__":
-  print(json.dumps(get_complete_static_example(), indent=2))
+  print(to_json(get_complete_static_example(), indent=2).decode())
@@ -1,7 +1,8 @@
 import sys
-import json
 import camdkit.model
 
+from pydantic_core import to_json
+
 if __name__ == "__main__":
   schema = camdkit.model.Clip.make_json_schema()
-  json.dump(schema, sys.stdout, indent=2)
+  sys.stdout.write(to_json(schema, indent=2).decode())
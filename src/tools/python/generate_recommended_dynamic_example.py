@@ -6,8 +6,9 @@
 
 '''CLI tool to generate and validate JSON for an example OpenTrackIO recommended dynamic metadata sample'''
 
-import json
+from pydantic_core import to_json
+
 from camdkit.examples import get_recommended_dynamic_example
 
 if __name__ == "__main__":
-  print(json.dumps(get_recommended_dynamic_example(), indent=2))
+  print(to_json(get_recommended_dynamic_example(), indent=2).decode())
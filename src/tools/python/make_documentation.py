@@ -1,12 +1,12 @@
 import typing
 import sys
-import json
 import camdkit.model
 import camdkit.red.reader
 import camdkit.arri.reader
 import camdkit.venice.reader
 import camdkit.canon.reader
 import camdkit.mosys.reader
+from pydantic_core import to_json
 
 _CLIP_INTRODUCTION = """# OSVP Clip Documentation
 
@@ -71,7 +71,7 @@ def generate_schema(fp: typing.TextIO, schema, title):
   fp.write(f"## {title} JSON Schema\n")
   fp.write("\n")
   fp.write("```")
-  json.dump(schema, fp, indent=2)
+  fp.write(to_json(schema, indent=2).decode())
   fp.write("\n")
   fp.write("```")
   fp.write("\n")
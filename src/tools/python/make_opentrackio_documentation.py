@@ -4,11 +4,12 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright Contributors to the SMTPE RIS OSVP Metadata Project
 
-import json, os, shutil
+import os, shutil
 from inspect import getmembers, isfunction
 
 import camdkit.examples
 from camdkit.model import Clip, OPENTRACKIO_PROTOCOL_VERSION
+from pydantic_core import to_json
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
 current_path = os.path.dirname(__file__)
@@ -23,7 +24,7 @@ def main():
   template_data = {
     "examples": {},
     "fields": Clip.make_documentation(),
-    "schema": json.dumps(Clip.make_json_schema(), indent=2),
+    "schema": to_json(Clip.make_json_schema(), indent=2).decode(),
     "version": ".".join(str(v) for v in OPENTRACKIO_PROTOCOL_VERSION)
   }
   # Generate all the examples
@@ -33,7 +34,7 @@ def main():
       example_name = function_name[4:]
       file_name = f"{example_name}.json"
       print(f"Generating {file_name}")
-      example_json = json.dumps(function(), indent=2)
+      example_json = to_json(function(), indent=2).decode()
       template_data["examples"][example_name] = example_json
       f = open(os.path.join(examples_path, file_name), "w")
       f.write(example_json)
@@ -44,7 +45,7 @@ def main():
   print(f"Generating {schema_file_name}")
   schema = camdkit.model.Clip.make_json_schema()
   f = open(os.path.join(docs_path, schema_file_name), "w")
-  schema_json = json.dumps(schema, indent=2)
+  schema_json = to_json(schema, indent=2).decode()
   f.write(schema_json)
   f.close()
 
@@ -61,7 +62,7 @@ def main():
   f.write(html)
   f.close()
   print("Publishing static web resources")
-  for folder in ["css", "img", "res"]:
+  for folder in ("css", "img", "res"):
     shutil.copytree(os.path.join(resources_path, folder), os.path.join(docs_path, folder), dirs_exist_ok=True)
 
 if __name__ == "__main__":